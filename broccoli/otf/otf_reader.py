@@ -0,0 +1,130 @@
+from fontTools.ttLib import TTFont
+from fontTools.pens.basePen import BasePen
+from typing import Iterator, Iterable, List, Tuple
+from pathlib import Path
+from broccoli.glyph import Glyph
+from broccoli.font import Font
+from carrot.vector_graphic import VectorGraphic
+from carrot.svg import Line, QuadraticCurve, CubicCurve
+from functools import reduce
+
+
+class SegmentPen(BasePen):
+    def __init__(self, glyph_set, num_points_for_approximation: int):
+        super().__init__(glyph_set)
+        self._num_points_for_approximation = num_points_for_approximation
+        self._contours: List[List[VectorGraphic]] = []
+        self._start_point_of_contour = None
+
+    @property
+    def contours(self) -> List[List[VectorGraphic]]:
+        return [contour for contour in self._contours if contour]
+
+    def _moveTo(self, point: Tuple[float, float]):
+        self._contours.append([])
+        self._start_point_of_contour = point
+
+    def _lineTo(self, point: Tuple[float, float]):
+        current_point = self._getCurrentPoint()
+        if current_point == point:
+            return
+        self._contours[-1].append(
+            Line(
+                start_point=current_point,
+                end_point=point,
+                num_points_for_approximation=self._num_points_for_approximation,
+            )
+        )
+
+    def _qCurveToOne(
+        self, control_point: Tuple[float, float], point: Tuple[float, float]
+    ):
+        self._contours[-1].append(
+            QuadraticCurve(
+                start_point=self._getCurrentPoint(),
+                end_point=point,
+                control_point=control_point,
+                num_points_for_approximation=self._num_points_for_approximation,
+            )
+        )
+
+    def _curveToOne(
+        self,
+        first_control_point: Tuple[float, float],
+        second_control_point: Tuple[float, float],
+        point: Tuple[float, float],
+    ):
+        self._contours[-1].append(
+            CubicCurve(
+                start_point=self._getCurrentPoint(),
+                end_point=point,
+                first_control_point=first_control_point,
+                second_control_point=second_control_point,
+                num_points_for_approximation=self._num_points_for_approximation,
+            )
+        )
+
+    def _closePath(self):
+        self._lineTo(self._start_point_of_contour)
+
+    def _endPath(self):
+        pass
+
+
+class OTFReader:
+    def __init__(
+        self,
+        glyph_names_to_read_in_font_files: Iterable[str],
+        num_points_for_glyph_as_sequence: int = 128,
+        num_points_for_internal_approximation: int = 2,
+    ):
+        self._glyph_names = glyph_names_to_read_in_font_files
+        self._num_points_for_glyph_as_sequence = num_points_for_glyph_as_sequence
+        self._num_points_for_approximation = num_points_for_internal_approximation
+
+    def read_font(self, path_to_otf_font_file: str or Path) -> Font:
+        path_to_otf_font_file = Path(path_to_otf_font_file)
+        font_name = path_to_otf_font_file.stem
+
+        font = TTFont(path_to_otf_font_file)
+        glyph_set = font.getGlyphSet()
+
+        return self._get_font_from_glyphs(
+            font_name, self._get_glyphs_from_glyph_set(glyph_set)
+        )
+
+    def _get_font_from_glyphs(self, font_name: str, glyphs: Iterator[Glyph]) -> Font:
+        return Font(font_name, glyphs, self._num_points_for_glyph_as_sequence)
+
+    def _get_glyphs_from_glyph_set(self, glyph_set) -> Iterator[Glyph]:
+        # sorted by name like the glyf table in ttx, so rows of font_to_numpy are the same
+        # glyphs whichever reader was used
+        desired_glyph_names = sorted(
+            filter(lambda name: name in glyph_set, set(self._glyph_names))
+        )
+        glyphs = map(
+            lambda name: self._get_glyph_from_glyph_set(glyph_set, name),
+            desired_glyph_names,
+        )
+        return filter(lambda g: g is not None, glyphs)
+
+    def _get_glyph_from_glyph_set(self, glyph_set, glyph_name: str) -> Glyph or None:
+        pen = SegmentPen(glyph_set, self._num_points_for_approximation)
+        glyph_set[glyph_name].draw(pen)
+
+        contours = pen.contours
+        if not contours:  # glyphs without outlines, e.g. space
+            return None
+
+        vector_graphics = map(
+            lambda c: self._get_vector_graphic_from_contour(c), contours
+        )
+        vg = reduce(lambda vg_0, vg_1: vg_0 + vg_1, vector_graphics)
+        return Glyph(glyph_name=glyph_name, vector_graphic_of_the_glyph=vg)
+
+    def _get_vector_graphic_from_contour(
+        self, contour: List[VectorGraphic]
+    ) -> VectorGraphic:
+        vg: VectorGraphic = reduce(lambda vg_0, vg_1: vg_0 + vg_1, contour)
+        vg.num_points_for_approximation = self._num_points_for_approximation
+        return vg
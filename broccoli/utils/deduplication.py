@@ -0,0 +1,310 @@
+from collections import defaultdict
+from itertools import count
+from math import erf, exp, log, pi, sqrt
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set
+from broccoli.font import Font
+from broccoli.utils.font_to_numpy import font_to_numpy
+import numpy as np
+
+# Glyphs are compared as point clouds, not as ordered point sequences, so that fonts whose
+# contours come in another order, start at another point or run the other way still match.
+# The distance between two glyphs is the mean distance from the points of one glyph to the
+# outline (polyline through the points) of the other, averaged over both directions.
+
+
+def get_collision_probability_of_p_stable_hash(
+    distance: float, bucket_width: float
+) -> float:
+    # probability that floor((a.x + b) / w) agrees for two points at this distance,
+    # with a ~ N(0, I) and b ~ U[0, w) (Datar et al., 2004)
+    if distance == 0:
+        return 1.0
+    u = bucket_width / distance
+    gaussian_cdf_of_minus_u = 0.5 * (1 + erf(-u / sqrt(2)))
+    return (
+        1
+        - 2 * gaussian_cdf_of_minus_u
+        - 2 / (sqrt(2 * pi) * u) * (1 - exp(-u * u / 2))
+    )
+
+
+def get_num_hashes_per_band_for_recall(
+    num_bands: int,
+    bucket_width_over_max_distance: float,
+    recall_at_max_distance: float,
+) -> int:
+    # the most hashes per band such that glyphs at the max distance still share a band
+    # with probability recall_at_max_distance
+    probability_of_sharing_a_band = 1 - (1 - recall_at_max_distance) ** (1 / num_bands)
+    probability_of_equal_hash = get_collision_probability_of_p_stable_hash(
+        1.0, bucket_width_over_max_distance
+    )
+    num_hashes = log(probability_of_sharing_a_band) / log(probability_of_equal_hash)
+    return max(int(num_hashes), 1)
+
+
+def get_mean_distances_to_outlines(
+    points: np.ndarray, points_of_outlines: np.ndarray
+) -> np.ndarray:
+    # mean distance from points[i] (num_points, 2) to the outline through
+    # points_of_outlines[i] (num_points_of_outline, 2), for every i;
+    # x and y are kept apart, reducing over an axis of length 2 is slow in numpy
+    start_x, start_y = points_of_outlines[..., 0], points_of_outlines[..., 1]
+    vector_x = np.roll(start_x, -1, axis=-1) - start_x
+    vector_y = np.roll(start_y, -1, axis=-1) - start_y
+    squared_segment_lengths = vector_x * vector_x + vector_y * vector_y
+
+    # points are spaced equally by arc length; much longer segments are jumps between contours
+    is_jump_between_contours = squared_segment_lengths > 4 * np.median(
+        squared_segment_lengths, axis=-1, keepdims=True
+    )
+
+    relative_x = points[..., 0][:, :, np.newaxis] - start_x[:, np.newaxis]
+    relative_y = points[..., 1][:, :, np.newaxis] - start_y[:, np.newaxis]
+    vector_x, vector_y = vector_x[:, np.newaxis], vector_y[:, np.newaxis]
+    t = np.clip(
+        (relative_x * vector_x + relative_y * vector_y)
+        / np.maximum(squared_segment_lengths, 1e-12)[:, np.newaxis],
+        0.0,
+        1.0,
+    )
+    offset_x = relative_x - t * vector_x
+    offset_y = relative_y - t * vector_y
+    squared_distances = np.where(
+        is_jump_between_contours[:, np.newaxis],
+        np.inf,
+        offset_x * offset_x + offset_y * offset_y,
+    )
+    return np.mean(np.sqrt(np.min(squared_distances, axis=-1)), axis=-1)
+
+
+def get_distances_between_glyphs(
+    glyph_as_array: np.ndarray, other_glyphs_as_array: np.ndarray
+) -> np.ndarray:
+    # symmetric mean distance between a glyph (num_points, 2) and each of the other glyphs
+    # (num_glyphs, num_points, 2)
+    glyph_repeated = np.broadcast_to(
+        glyph_as_array, (len(other_glyphs_as_array),) + glyph_as_array.shape
+    )
+    return 0.5 * (
+        get_mean_distances_to_outlines(glyph_repeated, other_glyphs_as_array)
+        + get_mean_distances_to_outlines(other_glyphs_as_array, glyph_repeated)
+    )
+
+
+class GlyphFingerprinter:
+    def __init__(
+        self,
+        max_mean_point_distance: float = 0.03,
+        num_bands: int = 32,
+        num_hashes_per_band: Optional[int] = None,
+        bucket_width_over_max_mean_point_distance: float = 4.0,
+        recall_at_max_mean_point_distance: float = 0.99,
+        distance_field_resolution: int = 16,
+        seed: int = 0,
+    ):
+        if max_mean_point_distance <= 0:
+            raise ValueError("max_mean_point_distance must be positive.")
+        if distance_field_resolution < 2:
+            raise ValueError("distance_field_resolution must be at least 2.")
+
+        self._num_bands = num_bands
+        self._num_hashes_per_band = (
+            num_hashes_per_band
+            or get_num_hashes_per_band_for_recall(
+                num_bands,
+                bucket_width_over_max_mean_point_distance,
+                recall_at_max_mean_point_distance,
+            )
+        )
+        self._bucket_width = (
+            bucket_width_over_max_mean_point_distance * max_mean_point_distance
+        )
+
+        grid = np.linspace(-1.0, 1.0, distance_field_resolution)
+        self._grid_points = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 2)
+
+        # p-stable (gaussian) projections of the distance field,
+        # see get_collision_probability_of_p_stable_hash
+        rng = np.random.default_rng(seed)
+        num_hashes = num_bands * self._num_hashes_per_band
+        self._projections = rng.standard_normal((num_hashes, len(self._grid_points)))
+        self._offsets = rng.uniform(0.0, self._bucket_width, num_hashes)
+
+    @property
+    def num_bands(self) -> int:
+        return self._num_bands
+
+    @property
+    def num_hashes_per_band(self) -> int:
+        return self._num_hashes_per_band
+
+    def distance_field(self, glyph_as_array: np.ndarray) -> np.ndarray:
+        # distance from each grid point to the nearest point of the glyph, which does not
+        # depend on the order of the points; scaled so that the euclidean distance between
+        # two distance fields is the root mean square of their differences
+        glyph_as_array = self._check_shape(glyph_as_array)
+        grid_x = self._grid_points[:, 0, np.newaxis]
+        grid_y = self._grid_points[:, 1, np.newaxis]
+        offset_x = grid_x - glyph_as_array[np.newaxis, :, 0]
+        offset_y = grid_y - glyph_as_array[np.newaxis, :, 1]
+        squared_distances = offset_x * offset_x + offset_y * offset_y
+        return np.sqrt(np.min(squared_distances, axis=-1)) / sqrt(
+            len(self._grid_points)
+        )
+
+    def band_keys(self, glyph_as_array: np.ndarray) -> List[bytes]:
+        hashes = np.floor(
+            (self._projections @ self.distance_field(glyph_as_array) + self._offsets)
+            / self._bucket_width
+        ).astype(np.int64)
+        bands = hashes.reshape(self._num_bands, self._num_hashes_per_band)
+        return [band.tobytes() for band in bands]
+
+    def _check_shape(self, glyph_as_array: np.ndarray) -> np.ndarray:
+        glyph_as_array = np.asarray(glyph_as_array, dtype=np.float64)
+        if glyph_as_array.ndim != 2 or glyph_as_array.shape[-1] != 2:
+            raise ValueError(
+                f"Expected a glyph array of shape (num_points, 2), got {glyph_as_array.shape}."
+            )
+        return glyph_as_array
+
+
+class NearDuplicateGlyphIndex:
+    def __init__(
+        self,
+        fingerprinter: Optional[GlyphFingerprinter] = None,
+        max_mean_point_distance: float = 0.03,
+    ):
+        self._fingerprinter = fingerprinter or GlyphFingerprinter(
+            max_mean_point_distance=max_mean_point_distance
+        )
+        self._max_mean_point_distance = max_mean_point_distance
+        self._glyphs: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            defaultdict(list) for _ in range(self._fingerprinter.num_bands)
+        ]
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def __contains__(self, key: Hashable):
+        return key in self._glyphs
+
+    def add(self, key: Hashable, glyph_as_array: np.ndarray):
+        if key in self._glyphs:
+            raise KeyError(f"{key} is already in the index.")
+
+        band_keys = self._fingerprinter.band_keys(glyph_as_array)
+        self._glyphs[key] = np.asarray(glyph_as_array, dtype=np.float32)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket[band_key].append(key)
+
+    def query(self, glyph_as_array: np.ndarray) -> List[Hashable]:
+        glyph_as_array = np.asarray(glyph_as_array, dtype=np.float32)
+
+        # candidates are compared in batches of glyphs with the same number of points
+        candidates_by_num_points: Dict[int, List[Hashable]] = defaultdict(list)
+        for key in self.get_candidates(glyph_as_array):
+            candidates_by_num_points[len(self._glyphs[key])].append(key)
+
+        near_duplicates = []
+        for candidates in candidates_by_num_points.values():
+            distances = get_distances_between_glyphs(
+                glyph_as_array, np.stack([self._glyphs[key] for key in candidates])
+            )
+            near_duplicates += [
+                key
+                for key, distance in zip(candidates, distances)
+                if distance <= self._max_mean_point_distance
+            ]
+        return near_duplicates
+
+    def get_candidates(self, glyph_as_array: np.ndarray) -> Set[Hashable]:
+        candidates = set()
+        band_keys = self._fingerprinter.band_keys(glyph_as_array)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            candidates.update(bucket.get(band_key, ()))
+        return candidates
+
+
+class NearDuplicateFontIndex:
+    def __init__(
+        self,
+        fingerprinter: Optional[GlyphFingerprinter] = None,
+        max_mean_point_distance: float = 0.03,
+        min_portion_of_matching_glyphs: float = 0.9,
+    ):
+        self._fingerprinter = fingerprinter or GlyphFingerprinter(
+            max_mean_point_distance=max_mean_point_distance
+        )
+        self._max_mean_point_distance = max_mean_point_distance
+        self._min_portion_of_matching_glyphs = min_portion_of_matching_glyphs
+        self._glyph_indices: Dict[str, NearDuplicateGlyphIndex] = {}
+        self._num_glyphs_of_fonts: Dict[Hashable, int] = {}
+
+    def __len__(self):
+        return len(self._num_glyphs_of_fonts)
+
+    def __contains__(self, font_key: Hashable):
+        return font_key in self._num_glyphs_of_fonts
+
+    def add(
+        self,
+        font_key: Hashable,
+        font_as_array: np.ndarray,
+        glyph_names: Iterable[str],
+    ):
+        if font_key in self._num_glyphs_of_fonts:
+            raise KeyError(f"{font_key} is already in the index.")
+
+        glyph_names = list(glyph_names)
+        for glyph_name, glyph_as_array in zip(glyph_names, font_as_array):
+            self._get_glyph_index(glyph_name).add(font_key, glyph_as_array)
+        self._num_glyphs_of_fonts[font_key] = len(glyph_names)
+
+    def query(
+        self, font_as_array: np.ndarray, glyph_names: Iterable[str]
+    ) -> List[Hashable]:
+        glyph_names = list(glyph_names)
+        if not glyph_names:
+            return []
+
+        num_matching_glyphs_of_fonts: Dict[Hashable, int] = defaultdict(int)
+        for glyph_name, glyph_as_array in zip(glyph_names, font_as_array):
+            if glyph_name not in self._glyph_indices:
+                continue
+            for font_key in self._glyph_indices[glyph_name].query(glyph_as_array):
+                num_matching_glyphs_of_fonts[font_key] += 1
+
+        return [
+            font_key
+            for font_key, num_matching_glyphs in num_matching_glyphs_of_fonts.items()
+            if num_matching_glyphs
+            / max(len(glyph_names), self._num_glyphs_of_fonts[font_key])
+            >= self._min_portion_of_matching_glyphs
+        ]
+
+    def _get_glyph_index(self, glyph_name: str) -> NearDuplicateGlyphIndex:
+        if glyph_name not in self._glyph_indices:
+            self._glyph_indices[glyph_name] = NearDuplicateGlyphIndex(
+                self._fingerprinter, self._max_mean_point_distance
+            )
+        return self._glyph_indices[glyph_name]
+
+
+def filter_near_duplicate_fonts(
+    fonts: Iterable[Font],
+    index: Optional[NearDuplicateFontIndex] = None,
+) -> Iterator[Font]:
+    # fonts are keyed by their position in the stream, names are not unique across families
+    index = index if index is not None else NearDuplicateFontIndex()
+    for font_key, font in zip(count(), fonts):
+        if len(font) == 0:  # none of the requested glyphs are in this font
+            continue
+        glyph_names = list(font)
+        font_as_array = font_to_numpy(font, scaled=True)
+        if index.query(font_as_array, glyph_names):
+            continue
+        index.add(font_key, font_as_array, glyph_names)
+        yield font
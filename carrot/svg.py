@@ -1,4 +1,7 @@
-from typing import Tuple, Callable, Optional
+from bisect import bisect_left
+from typing import Tuple, Callable, Optional, Iterator
+
+import numpy as np
 
 from carrot.vector_graphic import VectorGraphic
 
@@ -54,3 +57,130 @@ class QuadraticCurve(VectorGraphic):
 
     def __repr__(self):
         return f"QCurve: {self._start_point} --> ({self._control_point}) -> {self._end_point}"
+
+
+class CubicCurve(VectorGraphic):
+    def __init__(
+        self,
+        start_point: Tuple[float, float],
+        end_point: Tuple[float, float],
+        first_control_point: Tuple[float, float],
+        second_control_point: Tuple[float, float],
+        num_points_for_approximation: int,
+        num_points_for_arc_length_table: int = 64,
+    ):
+        if num_points_for_arc_length_table < 2:
+            raise ValueError("num_points_for_arc_length_table must be at least 2.")
+
+        self._control_point_matrix = np.array(
+            [start_point, first_control_point, second_control_point, end_point],
+            dtype=np.float64,
+        )
+        self._first_control_point = first_control_point
+        self._second_control_point = second_control_point
+
+        # t and the arc length from t=0 sampled on a grid; portion_s -> t by interpolation
+        self._t_table = np.linspace(0.0, 1.0, num_points_for_arc_length_table)
+        points_in_table = self.get_points_at_t(self._t_table)
+        self._arc_length_table = np.concatenate(
+            [
+                [0.0],
+                np.cumsum(
+                    np.linalg.norm(np.diff(points_in_table, axis=0), axis=-1)
+                ),
+            ]
+        )
+        length = float(self._arc_length_table[-1])
+
+        # plain python copies for evaluating one point at a time, which is how a sum of
+        # vector graphics (e.g. a Glyph) calls f_portion_s; numpy is slower per point there
+        self._control_points = [
+            start_point,
+            first_control_point,
+            second_control_point,
+            end_point,
+        ]
+        self._t_list = self._t_table.tolist()
+        self._arc_length_list = self._arc_length_table.tolist()
+
+        def f(portion_s: float) -> Tuple[float, float]:
+            return self._get_point_at_t(self._get_t_from_one_portion_s(portion_s))
+
+        super().__init__(
+            start_point,
+            end_point,
+            f_portion_s=f,
+            num_points_for_approximation=num_points_for_approximation,
+            approximate_length=length,
+        )
+
+    def get_points_at_t(self, t: np.ndarray) -> np.ndarray:
+        t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+        one_minus_t = 1 - t
+        bernstein_basis = np.concatenate(
+            [
+                one_minus_t * one_minus_t * one_minus_t,
+                3 * one_minus_t * one_minus_t * t,
+                3 * one_minus_t * t * t,
+                t * t * t,
+            ],
+            axis=-1,
+        )
+        return bernstein_basis @ self._control_point_matrix
+
+    def get_points_at_portion_s(self, portion_s: np.ndarray) -> np.ndarray:
+        return self.get_points_at_t(self._get_t_from_portion_s(portion_s))
+
+    def get_as_point_sequence(
+        self,
+        num_points_for_approximation: Optional[int] = None,
+        include_last_point: Optional[bool] = False,
+    ) -> Iterator[Tuple[float, float]]:
+        num_points_for_approximation = (
+            num_points_for_approximation or self._num_points_for_approximation
+        )
+        denominator = (
+            num_points_for_approximation - 1
+            if include_last_point
+            else num_points_for_approximation
+        )
+        portion_s = np.arange(num_points_for_approximation) / denominator
+        return map(tuple, self.get_points_at_portion_s(portion_s).tolist())
+
+    def _get_point_at_t(self, t: float) -> Tuple[float, float]:
+        (x_0, y_0), (x_1, y_1), (x_2, y_2), (x_3, y_3) = self._control_points
+        one_minus_t = 1 - t
+        b_0 = one_minus_t * one_minus_t * one_minus_t
+        b_1 = 3 * one_minus_t * one_minus_t * t
+        b_2 = 3 * one_minus_t * t * t
+        b_3 = t * t * t
+        return (
+            b_0 * x_0 + b_1 * x_1 + b_2 * x_2 + b_3 * x_3,
+            b_0 * y_0 + b_1 * y_1 + b_2 * y_2 + b_3 * y_3,
+        )
+
+    def _get_t_from_one_portion_s(self, portion_s: float) -> float:
+        length = self._arc_length_list[-1]
+        if length == 0:
+            return portion_s
+
+        arc_length = portion_s * length
+        if arc_length <= 0:
+            return 0.0
+        if arc_length >= length:
+            return 1.0
+
+        i = bisect_left(self._arc_length_list, arc_length)
+        s_0, s_1 = self._arc_length_list[i - 1], self._arc_length_list[i]
+        t_0, t_1 = self._t_list[i - 1], self._t_list[i]
+        return t_0 + (t_1 - t_0) * (arc_length - s_0) / (s_1 - s_0)
+
+    def _get_t_from_portion_s(self, portion_s: np.ndarray) -> np.ndarray:
+        portion_s = np.asarray(portion_s, dtype=np.float64)
+        length = self._arc_length_table[-1]
+        if length == 0:
+            return portion_s
+        return np.interp(portion_s * length, self._arc_length_table, self._t_table)
+
+    def __repr__(self):
+        return f"CCurve: {self._start_point} --> ({self._first_control_point}, {self._second_control_point}) -> {self._end_point}"
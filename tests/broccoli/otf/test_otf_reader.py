@@ -0,0 +1,132 @@
+from broccoli.otf.otf_reader import OTFReader
+from broccoli.ttf.ttf_reader import TTFReader
+from broccoli.utils.font_to_numpy import font_to_numpy
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+import numpy as np
+import pytest
+
+# not sorted by name, unlike the glyf table in ttx
+_GLYPH_ORDER = [".notdef", "space", "B", "A"]
+
+
+def _draw_a(pen):
+    pen.moveTo((100, 0))
+    pen.lineTo((300, 700))
+    pen.lineTo((500, 0))
+    pen.closePath()
+
+
+def _draw_b_with_quadratic_curves(pen):
+    pen.moveTo((100, 0))
+    pen.lineTo((100, 700))
+    pen.qCurveTo((500, 700), (500, 350))
+    pen.qCurveTo((500, 0), (100, 0))
+    pen.closePath()
+
+
+def _draw_b_with_cubic_curves(pen):
+    pen.moveTo((100, 0))
+    pen.lineTo((100, 700))
+    pen.curveTo((400, 700), (500, 600), (500, 350))
+    pen.curveTo((500, 100), (400, 0), (100, 0))
+    pen.closePath()
+
+
+def _draw_nothing(pen):
+    pass
+
+
+def _build_font(fb: FontBuilder):
+    fb.setupGlyphOrder(_GLYPH_ORDER)
+    fb.setupCharacterMap({ord("A"): "A", ord("B"): "B", ord(" "): "space"})
+    fb.setupHorizontalMetrics({name: (600, 0) for name in _GLYPH_ORDER})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+
+
+@pytest.fixture
+def path_to_ttf_font_file(tmp_path):
+    draw_functions = {
+        ".notdef": _draw_nothing,
+        "A": _draw_a,
+        "B": _draw_b_with_quadratic_curves,
+        "space": _draw_nothing,
+    }
+    glyphs = {}
+    for name, draw in draw_functions.items():
+        pen = TTGlyphPen(None)
+        draw(pen)
+        glyphs[name] = pen.glyph()
+
+    fb = FontBuilder(1000, isTTF=True)
+    _build_font(fb)
+    fb.setupGlyf(glyphs)
+    fb.setupPost()
+    path = tmp_path / "test.ttf"
+    fb.save(str(path))
+    return path
+
+
+@pytest.fixture
+def path_to_otf_font_file(tmp_path):
+    draw_functions = {
+        ".notdef": _draw_nothing,
+        "A": _draw_a,
+        "B": _draw_b_with_cubic_curves,
+        "space": _draw_nothing,
+    }
+    charstrings = {}
+    for name, draw in draw_functions.items():
+        pen = T2CharStringPen(600, None)
+        draw(pen)
+        charstrings[name] = pen.getCharString()
+
+    fb = FontBuilder(1000, isTTF=False)
+    _build_font(fb)
+    fb.setupCFF("Test", {"FullName": "Test"}, charstrings, {})
+    fb.setupPost()
+    path = tmp_path / "test.otf"
+    fb.save(str(path))
+    return path
+
+
+def test_font_to_numpy_works_on_both_formats(
+    path_to_ttf_font_file, path_to_otf_font_file
+):
+    reader = OTFReader("AB", num_points_for_glyph_as_sequence=32)
+    for path in [path_to_ttf_font_file, path_to_otf_font_file]:
+        font = reader.read_font(path)
+        assert font_to_numpy(font).shape == (2, 32, 2)
+
+
+def test_reading_ttf_matches_ttf_reader(path_to_ttf_font_file, tmp_path):
+    otf_font = OTFReader("AB", num_points_for_glyph_as_sequence=32).read_font(
+        path_to_ttf_font_file
+    )
+    ttf_font = TTFReader("AB", num_points_for_glyph_as_sequence=32).read_font(
+        path_to_ttf_font_file, str(tmp_path / "ttx")
+    )
+
+    assert list(otf_font) == list(ttf_font) == ["A", "B"]
+    assert np.allclose(font_to_numpy(otf_font), font_to_numpy(ttf_font))
+
+
+def test_glyphs_are_in_the_same_order_for_both_formats(
+    path_to_ttf_font_file, path_to_otf_font_file
+):
+    reader = OTFReader("BA")
+    fonts = [
+        reader.read_font(path_to_ttf_font_file),
+        reader.read_font(path_to_otf_font_file),
+    ]
+
+    assert [list(font) for font in fonts] == [["A", "B"], ["A", "B"]]
+
+
+def test_glyphs_without_outlines_are_skipped(path_to_otf_font_file):
+    font = OTFReader(["A", "space"]).read_font(path_to_otf_font_file)
+
+    assert list(font) == ["A"]
@@ -0,0 +1,190 @@
+from broccoli.font import Font
+from broccoli.glyph import Glyph
+from broccoli.utils.deduplication import (
+    GlyphFingerprinter,
+    NearDuplicateGlyphIndex,
+    NearDuplicateFontIndex,
+    filter_near_duplicate_fonts,
+)
+from carrot.svg import Line
+from functools import reduce
+import numpy as np
+
+
+def _make_glyph(seed: int, num_points: int = 128) -> np.ndarray:
+    t = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    rng = np.random.default_rng(seed)
+    coefficients = rng.uniform(-0.5, 0.5, size=(2, 2))
+    x = np.sin(t) * coefficients[0, 0] + np.cos(2 * t) * coefficients[1, 0]
+    y = np.cos(t) * coefficients[0, 1] + np.sin(3 * t) * coefficients[1, 1]
+    return np.stack([x, y], axis=-1)
+
+
+def _make_o_like_glyph(
+    frequency_of_wobble: int, phase_of_wobble: float, num_points: int = 128
+) -> np.ndarray:
+    t = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    circle = np.stack([np.cos(t), np.sin(t)], axis=-1)
+    wobble = np.stack(
+        [
+            np.cos(frequency_of_wobble * t + phase_of_wobble),
+            np.sin(frequency_of_wobble * t + phase_of_wobble),
+        ],
+        axis=-1,
+    )
+    return 0.8 * circle + 0.25 * wobble
+
+
+def _make_glyph_with_two_contours(
+    reorder_contours: bool, num_points: int = 128
+) -> np.ndarray:
+    # an outer and an inner ring, like an "o"; points are spaced equally by arc length
+    num_points_of_inner_ring = num_points // 4
+    num_points_of_outer_ring = num_points - num_points_of_inner_ring
+
+    def ring(radius, num_points_of_ring, start_angle, direction):
+        t = start_angle + direction * np.linspace(
+            0, 2 * np.pi, num_points_of_ring, endpoint=False
+        )
+        return radius * np.stack([np.cos(t), np.sin(t)], axis=-1)
+
+    if not reorder_contours:
+        return np.concatenate(
+            [
+                ring(1.0, num_points_of_outer_ring, 0.0, 1),
+                ring(0.4, num_points_of_inner_ring, 0.0, -1),
+            ]
+        )
+    # the inner ring first, both rings starting elsewhere and running the other way
+    return np.concatenate(
+        [
+            ring(0.4, num_points_of_inner_ring, 2.0, 1),
+            ring(1.0, num_points_of_outer_ring, 1.0, -1),
+        ]
+    )
+
+
+def _make_font(font_name: str, glyph_names_and_polygons, num_points: int = 32) -> Font:
+    def make_glyph(glyph_name, polygon):
+        lines = map(
+            lambda p_0, p_1: Line(p_0, p_1, num_points_for_approximation=2),
+            polygon,
+            polygon[1:] + polygon[:1],
+        )
+        return Glyph(
+            glyph_name,
+            vector_graphic_of_the_glyph=reduce(lambda vg_0, vg_1: vg_0 + vg_1, lines),
+        )
+
+    return Font(
+        font_name,
+        [make_glyph(name, polygon) for name, polygon in glyph_names_and_polygons],
+        num_points,
+    )
+
+
+_SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+_TRIANGLE = [(0.0, 0.0), (1.0, 0.0), (0.5, 1.0)]
+_DIAMOND = [(0.5, 0.0), (1.0, 0.5), (0.5, 1.0), (0.0, 0.5)]
+
+
+def test_distance_field_does_not_depend_on_order_of_points():
+    fingerprinter = GlyphFingerprinter()
+    glyph = _make_glyph(0)
+    shuffled = np.random.default_rng(0).permutation(glyph)
+
+    assert np.allclose(
+        fingerprinter.distance_field(glyph), fingerprinter.distance_field(shuffled)
+    )
+
+
+def test_glyph_index_finds_near_duplicates_only():
+    index = NearDuplicateGlyphIndex()
+    for seed in range(50):
+        index.add(seed, _make_glyph(seed))
+
+    slightly_perturbed = _make_glyph(7) + 0.002
+    assert index.query(slightly_perturbed) == [7]
+    assert index.query(_make_glyph(1000)) == []
+
+
+def test_glyph_index_finds_glyphs_with_reordered_contours():
+    index = NearDuplicateGlyphIndex()
+    index.add("original", _make_glyph_with_two_contours(reorder_contours=False))
+    for seed in range(20):
+        index.add(seed, _make_glyph(seed))
+
+    assert index.query(_make_glyph_with_two_contours(reorder_contours=True)) == [
+        "original"
+    ]
+
+
+def test_similar_but_distinct_glyphs_are_not_candidates():
+    # o-like glyphs that are similar to each other, but all further apart than the
+    # max_mean_point_distance
+    glyphs = [
+        _make_o_like_glyph(frequency, phase)
+        for frequency in (2, 3, 4, 5, 6)
+        for phase in np.linspace(0, 2 * np.pi, 9, endpoint=False)
+    ]
+    index = NearDuplicateGlyphIndex()
+    for key, glyph in enumerate(glyphs):
+        index.add(key, glyph)
+
+    num_candidates_that_are_other_glyphs = 0
+    for key, glyph in enumerate(glyphs):
+        candidates = index.get_candidates(glyph + 0.005)
+        assert key in candidates
+        num_candidates_that_are_other_glyphs += len(candidates - {key})
+
+    # less than one other glyph per query, however many glyphs are in the index
+    assert num_candidates_that_are_other_glyphs < len(glyphs)
+
+
+def test_font_index_matches_fonts_by_glyph_name():
+    index = NearDuplicateFontIndex()
+    glyph_names = ["A", "B", "C"]
+    font_as_array = np.stack([_make_glyph(seed) for seed in range(3)])
+    index.add("original", font_as_array, glyph_names)
+
+    assert index.query(font_as_array + 0.002, glyph_names) == ["original"]
+    assert index.query(font_as_array, ["C", "B", "A"]) == []
+
+
+def test_filter_drops_near_duplicate_fonts():
+    original = _make_font("original", [("A", _SQUARE), ("B", _TRIANGLE)])
+    renamed_clone = _make_font("clone", [("A", _SQUARE), ("B", _TRIANGLE)])
+    distinct = _make_font("distinct", [("A", _DIAMOND), ("B", _SQUARE)])
+
+    kept = list(filter_near_duplicate_fonts([original, renamed_clone, distinct]))
+
+    assert kept == [original, distinct]
+
+
+def test_filter_drops_fonts_with_reordered_outlines():
+    original = _make_font("original", [("A", _SQUARE), ("B", _TRIANGLE)])
+    reexported = _make_font(
+        "reexported",
+        [
+            ("A", list(reversed(_SQUARE[2:] + _SQUARE[:2]))),
+            ("B", _TRIANGLE[1:] + _TRIANGLE[:1]),
+        ],
+    )
+
+    assert list(filter_near_duplicate_fonts([original, reexported])) == [original]
+
+
+def test_filter_keeps_distinct_fonts_with_the_same_name():
+    regular_of_family_a = _make_font("Regular", [("A", _SQUARE), ("B", _TRIANGLE)])
+    regular_of_family_b = _make_font("Regular", [("A", _DIAMOND), ("B", _SQUARE)])
+
+    kept = list(filter_near_duplicate_fonts([regular_of_family_a, regular_of_family_b]))
+
+    assert kept == [regular_of_family_a, regular_of_family_b]
+
+
+def test_filter_skips_fonts_without_glyphs():
+    empty = _make_font("empty", [])
+    font = _make_font("font", [("A", _SQUARE)])
+
+    assert list(filter_near_duplicate_fonts([empty, font])) == [font]
@@ -1,6 +1,7 @@
-from carrot.svg import Line, QuadraticCurve
+from carrot.svg import Line, QuadraticCurve, CubicCurve
 from itertools import count, repeat
 import operator
+import pytest
 
 
 def test_line():
@@ -67,3 +68,88 @@ def test_addition():
     assert round(combination.get_approximate_length(), 2) == round(
         line.get_approximate_length() + curve.get_approximate_length(), 2
     )
+
+
+def test_degenerate_cubic_curve():
+    start_point = (0.15, 0.35)
+    end_point = (0.61, 0.23)
+    first_control_point = (
+        (2 * start_point[0] + end_point[0]) / 3,
+        (2 * start_point[1] + end_point[1]) / 3,
+    )
+    second_control_point = (
+        (start_point[0] + 2 * end_point[0]) / 3,
+        (start_point[1] + 2 * end_point[1]) / 3,
+    )
+
+    line = Line(start_point, end_point, num_points_for_approximation=10)
+    degenerate_curve = CubicCurve(
+        start_point,
+        end_point,
+        first_control_point,
+        second_control_point,
+        num_points_for_approximation=10,
+    )
+
+    paramters_for_both_vector_graphics = list(
+        map(operator.truediv, range(0, 10 + 1), repeat(10))
+    )
+    points_on_line = map(lambda z: line(z), paramters_for_both_vector_graphics)
+    points_on_degenerate_curve = map(
+        lambda z: degenerate_curve(z), paramters_for_both_vector_graphics
+    )
+
+    for point_on_line, point_on_degenerate_curve in zip(
+        points_on_line, points_on_degenerate_curve
+    ):
+        for coordinate, reference_coordinate in zip(
+            point_on_line, point_on_degenerate_curve
+        ):
+            assert round(coordinate, 2) == round(reference_coordinate, 2)
+
+    assert round(line.get_approximate_length(), 2) == round(
+        degenerate_curve.get_approximate_length(), 2
+    )
+
+
+def test_cubic_curve_is_parameterized_by_portion_of_arc_length():
+    curve = CubicCurve(
+        (0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0), num_points_for_approximation=10
+    )
+
+    points = list(curve.get_as_point_sequence(include_last_point=True))
+    distances_between_adjacent_points = list(
+        map(
+            lambda p_0, p_1: ((p_0[0] - p_1[0]) ** 2 + (p_0[1] - p_1[1]) ** 2) ** 0.5,
+            points,
+            points[1:],
+        )
+    )
+
+    for distance in distances_between_adjacent_points:
+        assert round(distance, 2) == round(distances_between_adjacent_points[0], 2)
+
+
+def test_cubic_curve_needs_at_least_2_points_for_arc_length_table():
+    with pytest.raises(ValueError):
+        CubicCurve(
+            (0.0, 0.0),
+            (1.0, 0.0),
+            (0.0, 1.0),
+            (1.0, 1.0),
+            num_points_for_approximation=10,
+            num_points_for_arc_length_table=1,
+        )
+
+
+def test_cubic_curve_point_sequence_matches_calling_the_curve():
+    curve = CubicCurve(
+        (0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0), num_points_for_approximation=10
+    )
+
+    for point, reference_point in zip(
+        curve.get_as_point_sequence(include_last_point=True),
+        map(lambda z: curve(z / 9), range(10)),
+    ):
+        for coordinate, reference_coordinate in zip(point, reference_point):
+            assert round(coordinate, 6) == round(reference_coordinate, 6)